@@ -115,6 +115,8 @@ def test_getTerms():
     assert getTerms("a > b") == ['a', '>', 'b']
     assert getTerms("a <= b") == ['a', '<=', 'b']
     assert getTerms("a >= b") == ['a', '>=', 'b']
+    assert getTerms("sinhx <=2.5x^(3)") == ['sinh', 'x', '<=', '2.5', 'x', '^', '(', '3', ')']
+    assert getTerms("x ! .5 _ y") == ['x', '5', 'y']
 
     assert getTerms("[1,0;0,1]") == ['[', '1', ',', '0', ';', '0', ',', '1', ']']
     assert getTerms("2*[2,3;2,3]+[1,2;1,2]") == ['2', '*', '[', '2', ',', '3', ';', '2', ',', '3', ']', '+', '[', '1', ',', '2', ';', '1', ',', '2', ']']
@@ -1,7 +1,10 @@
-from visma.simplify.simplify import simplify, simplifyEquation
+from visma.simplify.simplify import simplify, simplifyEquation, simplifification, moveRTokensToLTokens, expressionCache, simplifificationCache
+from visma.io.parser import tokensToString
+from visma.functions.operator import Binary
 from visma.simplify.addsub import addition, additionEquation, subtraction, subtractionEquation
 from visma.simplify.muldiv import multiplication, division
-from tests.tester import quickTest
+from visma.io.tokenize import tokenizer, getLHSandRHS, removeSpaces
+from tests.tester import quickTest, getTokens
 
 #####################
 # simplify.simplify #
@@ -60,6 +63,32 @@ def test_simplify():
     assert quickTest("((x + 1) * (x - 1) + (100 + 1))", simplify) == "x^(2.0)+100.0"
     #  assert quickTest("-1 * (- x - 1)", simplify) == "x--1"   FIXME: case should have a probably fix with the overlaoding of Constant Function
 
+    # Tests regarding zero terms and factors of one
+    assert quickTest("x + 0", simplify) == "x"
+    assert quickTest("0 + x - 0", simplify) == "x"
+    assert quickTest("x*y*0 - 2", simplify) == "-2.0"
+    assert quickTest("2 * x * 0 + y", simplify) == "y"
+    assert quickTest("1 * x + y / 1", simplify) == "x+y"
+    assert quickTest("0 - 0 + x", simplify) == "x"
+    assert quickTest("0 - 0*y + x", simplify) == "x"
+    assert quickTest("0 - x + y", simplify) == "-x+y"
+    assert quickTest("1 * (0 - (x*0)) * (2x+3) + 2x", simplify) == "2.0x"
+    tokens, _, token_string, _, _ = simplifification([Binary('-')] + tokenizer("x * 0"))
+    assert len(tokens) == 1 and tokens[0].isZero() and token_string == "0"
+    assert quickTest("0x + y", simplify) == "y"
+    assert quickTest("0x + y + 1", simplify) == "y+1.0"
+    assert quickTest("x + 0y - 2", simplify) == "x-2.0"
+    _, _, token_string, animation, comments = simplifification([Binary('-')] + tokenizer("x + y"))
+    assert removeSpaces(token_string) == "-x+y" and len(animation) == 1 and comments == []
+
+    # Tests regarding tokens which are not functions (bare numbers and matrices)
+    _, _, _, animation, _ = simplify(tokenizer("-(2)"))
+    assert animation[0] == [-2.0]
+    _, _, token_string, _, _ = simplify(tokenizer("2*[2,3;2,3]+[1,2;1,2]"))
+    assert removeSpaces(token_string) == "2.0*[2.0,3.0;2.0,3.0]+[1.0,2.0;1.0,2.0]"
+    _, _, token_string, _, _ = simplify(tokenizer("x + [1,2;3,4]"))
+    assert removeSpaces(token_string) == "x+[1.0,2.0;3.0,4.0]"
+
     # Tests regarding Exponents & Expressions
     assert quickTest("(x + 1)^3", simplify) == "x^(3.0)+3x^(2.0)+3x+1.0"
     assert quickTest("(x + 1)^2*x", simplify) == "x^(3.0)+2x^(2.0)+x"
@@ -75,6 +104,38 @@ def test_simplify():
     assert quickTest("(1 + 3)^(x) + (2 + 3)^(x)", simplify) == "4.0^x+5.0^x"
     assert quickTest("(1 + 3)^(1/3) + (2 + 3)^(2/3)", simplify) == "4.0^0.33+5.0^0.67"
 
+    # Tests regarding repeated simplifications (served from the cache)
+    expressionCache.clear()
+    simplifificationCache.clear()
+    assert quickTest("(x + 2) * (x + 3) + (x + 2) * (x + 3)", simplify) == "2x^(2.0)+10.0x+12.0"
+    cachedTokens, _, cachedString, _, _ = next(reversed(simplifificationCache.values()))
+    tokens, _, token_string, _, _ = simplify(getTokens("(x + 2) * (x + 3) + (x + 2) * (x + 3)"))
+    assert token_string is cachedString and removeSpaces(token_string) == "2x^(2.0)+10.0x+12.0"
+    assert tokensToString(tokens) == tokensToString(cachedTokens)
+    assert not any(token is cachedToken for token, cachedToken in zip(tokens, cachedTokens))
+    tokens, _, _, _, _ = simplify(getTokens("(y + 1) * (y + 1)"))
+    tokens[0].coefficient = 5
+    assert quickTest("(y + 1) * (y + 1)", simplify) == "y^(2.0)+2y+1.0"
+
+    # Tests regarding already simplified input
+    _, availableOperations, token_string, animation, comments = simplify(tokenizer("2x + 3 - y"))
+    assert removeSpaces(token_string) == "2.0x+3.0-y" and availableOperations == []
+    assert len(animation) == len(comments) == 1
+    _, _, token_string, animation, comments = simplify(tokenizer("0x + 1"))
+    assert removeSpaces(token_string) == "1.0" and len(animation) == len(comments) > 1
+
+    # Tests regarding simplification without animation
+    lTokens, rTokens = getLHSandRHS(tokenizer("x = 2*(z + q)"))
+    _, _, _, token_string, animation, _ = simplifyEquation(lTokens, rTokens, animate=False)
+    assert removeSpaces(token_string) == "x-2.0z-2.0q=0"
+    assert animation == []
+
+    # Tests regarding moving RHS tokens to LHS
+    lTokens, rTokens = moveRTokensToLTokens(*getLHSandRHS(tokenizer("x = -3 - 2y")))
+    assert removeSpaces(tokensToString(lTokens)) == "x+3.0+2.0y" and rTokens == []
+    lTokens, rTokens = moveRTokensToLTokens(*getLHSandRHS(tokenizer("x + 1 = -y + 2")))
+    assert removeSpaces(tokensToString(lTokens)) == "x+1.0+y-2.0" and rTokens == []
+
 
 def test_addsub():
 
@@ -88,6 +149,14 @@ def test_addsub():
     assert quickTest("1 + 2 + 3", addition) == "6.0"
     assert quickTest("1 + 2 + x + 3x", addition) == "3.0+4.0x"
 
+    # Tests regarding animation frames sharing unchanged tokens
+    tokens, _, _, animation, _ = addition(getTokens("x + 1 + y + 2"))
+    assert animation[0][0] is animation[-1][0] and tokens[0] is not animation[-1][0]
+    _, _, _, animation, _ = addition(tokenizer("-(2)"))
+    assert animation == [[-2.0]]
+    lTokens, _, _, _, animation, _ = additionEquation(*getLHSandRHS(tokenizer("x + 1 + 2 = y")))
+    assert animation[0][0] is animation[-1][0] and lTokens[0] is not animation[-1][0]
+
     assert quickTest("1 + 2 = x + 3x", additionEquation) == "3.0=4.0x"
     assert quickTest("y + 2 = -x + x", additionEquation) == "y+2.0=0"
 
@@ -4,6 +4,8 @@ import math
 ROUNDOFF = 2
 # FIXME: Make ROUNDOFF global
 INPUT_TYPE = "Greek"
+# number of simplified results remembered by the simplify module
+SIMPLIFY_CACHE_SIZE = 4096
 
 # constants
 PI = math.pi
@@ -1,3 +1,6 @@
+from visma.functions.structure import cloneToken
+
+
 class Operator(object):
     """The Operator class is for operators(+, -, *, / etc)
 
@@ -18,6 +21,14 @@ class Operator(object):
         represent += str(self.value)
         return represent
 
+    def clone(self):
+        """Returns a copy of the operator token
+
+        Returns:
+            inst {visma.functions.operator.Operator} -- copy of the token
+        """
+        return cloneToken(self)
+
     def differentiate(self):
         return self
 
@@ -1,5 +1,76 @@
 import copy
 
+IMMUTABLE_TYPES = (int, float, complex, str, bool, type(None))
+
+# A step consumes at most a term, its operator and the next term, so an unchanged token is at most this far ahead in the last frame
+SNAPSHOT_WINDOW = 3
+
+
+def cloneValue(value):
+    """Copies an attribute value of a token
+
+    Lists are copied recursively and tokens are cloned, immutable values are shared.
+
+    Arguments:
+        value {object} -- attribute value of a token
+
+    Returns:
+        value {object} -- copy of the attribute value
+    """
+    if isinstance(value, IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, list):
+        return [cloneValue(val) for val in value]
+    if hasattr(value, 'clone'):
+        return value.clone()
+    return copy.deepcopy(value)
+
+
+def cloneToken(token):
+    """Copies a token without copy.deepcopy, only the attributes of the token are walked
+
+    Arguments:
+        token {object} -- function or operator token
+
+    Returns:
+        inst {object} -- copy of the token
+    """
+    inst = object.__new__(type(token))
+    inst.__dict__ = {attr: cloneValue(val) for attr, val in token.__dict__.items()}
+    return inst
+
+
+def snapshotTokens(tokens, animation=None):
+    """Copies tokens for a new animation frame
+
+    Frames are never modified once stored, so tokens which are unchanged since the last frame share its copy
+    instead of being cloned again.
+
+    Arguments:
+        tokens {list} -- list of tokens of the current step
+
+    Keyword Arguments:
+        animation {list} -- frames stored so far (default: {None})
+
+    Returns:
+        frame {list} -- list of tokens for the animation
+    """
+    previous = animation[-1] if animation else []
+    frame = []
+    j = 0
+    for token in tokens:
+        if isinstance(token, IMMUTABLE_TYPES):
+            frame.append(token)
+            continue
+        for k in range(j, min(j + SNAPSHOT_WINDOW, len(previous))):
+            if type(previous[k]) is type(token) and previous[k].__dict__ == token.__dict__:
+                frame.append(previous[k])
+                j = k + 1
+                break
+        else:
+            frame.append(cloneValue(token))
+    return frame
+
 
 class Function(object):
     """Basis function class for all functions
@@ -97,6 +168,14 @@ class Function(object):
         if operator is not None:
             self.operator = operator
 
+    def clone(self):
+        """Returns a copy of the function token
+
+        Returns:
+            inst {visma.functions.structure.Function} -- copy of the token
+        """
+        return cloneToken(self)
+
     def differentiate(self):
         """Differentiate function token
         """
@@ -193,6 +272,20 @@ class Expression(Function):
         self.tokens = []
         if tokens is not None:
             self.tokens.extend(tokens)
+        # Set by the simplify module once the tokens are in simplified form
+        self.simplified = False
+
+    def clone(self):
+        """Returns a copy of the expression token
+
+        The copy is not trusted to be simplified since the original may be changed in place afterwards.
+
+        Returns:
+            inst {visma.functions.structure.Expression} -- copy of the token
+        """
+        inst = super().clone()
+        inst.simplified = False
+        return inst
 
     def __str__(self):
         represent = ""
@@ -548,6 +548,25 @@ def getLevelVariables(tokens):
     return variables
 
 
+def getMulDivOperations(tokens, operations):
+    """Adds '*' and '/' to operations if they are placed between two Variable/Constant tokens
+
+    The classes of the tokens are gathered in a single pass first, so that the neighbours of each operator are
+    checked without going through the tokens again.
+
+    Arguments:
+        tokens {list} -- list of function tokens
+        operations {list} -- list of operations which can be performed
+    """
+    kinds = [token.__class__ for token in tokens]
+    operands = (Variable, Constant)
+    for i in range(1, len(tokens) - 1):
+        if issubclass(kinds[i], Binary) and kinds[i - 1] in operands and kinds[i + 1] in operands:
+            op = tokens[i].value
+            if op in ('*', '/') and op not in operations:
+                operations.append(op)
+
+
 def getOperationsEquation(lVariables, lTokens, rVariables, rTokens):
     """Returns a list of operations which can be performed on given equation tokens
 
@@ -561,37 +580,8 @@ def getOperationsEquation(lVariables, lTokens, rVariables, rTokens):
         operations {list} -- list of operations which can be performed
     """
     operations = []
-    for i, token in enumerate(lTokens):
-        if isinstance(token, Binary):
-            if token.value in ['*', '/']:
-                prev = False
-                nxt = False
-                if i != 0:
-                    if lTokens[i - 1].__class__ in [Variable, Constant]:
-                        prev = True
-                if i + 1 < len(lTokens):
-                    if lTokens[i + 1].__class__ in [Variable, Constant]:
-                        nxt = True
-                if nxt and prev:
-                    op = token.value
-                    if op not in operations:
-                        operations.append(op)
-
-    for i, token in enumerate(rTokens):
-        if isinstance(token, Binary):
-            if token.value in ['*', '/']:
-                prev = False
-                nxt = False
-                if i != 0:
-                    if rTokens[i - 1].__class__ in [Variable, Constant]:
-                        prev = True
-                if i + 1 < len(rTokens):
-                    if rTokens[i + 1].__class__ in [Variable, Constant]:
-                        nxt = True
-                if nxt and prev:
-                    op = token.value
-                    if op not in operations:
-                        operations.append(op)
+    getMulDivOperations(lTokens, operations)
+    getMulDivOperations(rTokens, operations)
 
     for i, variable in enumerate(lVariables):
         if isinstance(variable, Constant):
@@ -230,89 +230,87 @@ def tokensToString(tokens):
         tokenString {string} -- equation string
     """
     # FIXME: tokensToString method
-    tokenString = ''
+    # Parts are collected in a list and joined once, repeated string concatenation is quadratic for long expressions
+    tokenString = []
     for token in tokens:
         if isinstance(token, Constant):
             if isinstance(token.value, list):
-                for j, val in token.value:
-                    if token['power'][j] != 1:
-                        tokenString += (str(val) + '^(' + str(token.power[j]) + ')')
+                for j, val in enumerate(token.value):
+                    if token.power[j] != 1:
+                        tokenString.append(str(val) + '^(' + str(token.power[j]) + ')')
                     else:
-                        tokenString += str(val)
+                        tokenString.append(str(val))
             elif isNumber(token.value):
                 if token.power != 1:
-                    tokenString += (str(token.value) + '^(' + str(token.power) + ')')
+                    tokenString.append(str(token.value) + '^(' + str(token.power) + ')')
                 else:
-                    tokenString += str(token.value)
+                    tokenString.append(str(token.value))
         elif isinstance(token, Variable):
             if token.coefficient == 1:
                 pass
             elif token.coefficient == -1:
-                tokenString += '-'
+                tokenString.append('-')
             else:
-                tokenString += str(token.coefficient)
+                tokenString.append(str(token.coefficient))
             for j, val in enumerate(token.value):
                 if token.power[j] != 1:
-                    tokenString += (str(val) + '^(' + str(token.power[j]) + ')')
+                    tokenString.append(str(val) + '^(' + str(token.power[j]) + ')')
                 else:
-                    tokenString += str(val)
+                    tokenString.append(str(val))
         elif isinstance(token, Binary):
-            tokenString += ' ' + str(token.value) + ' '
+            tokenString.append(' ' + str(token.value) + ' ')
         elif isinstance(token, Expression):
             if token.coefficient != 1:
-                tokenString += str(token.coefficient) + '*'
-            tokenString += '('
-            tokenString += tokensToString(token.tokens)
-            tokenString += ')'
+                tokenString.append(str(token.coefficient) + '*')
+            tokenString.append('(')
+            tokenString.append(tokensToString(token.tokens))
+            tokenString.append(')')
             if token.power != 1:
-                tokenString += '^(' + str(token.power) + ')'
+                tokenString.append('^(' + str(token.power) + ')')
         elif isinstance(token, Sqrt):
-            tokenString += 'sqrt['
+            tokenString.append('sqrt[')
             if isinstance(token.power, Constant):
-                tokenString += tokensToString([token.power])
+                tokenString.append(tokensToString([token.power]))
             elif isinstance(token.power, Variable):
-                tokenString += tokensToString([token.power])
+                tokenString.append(tokensToString([token.power]))
             elif isinstance(token.power, Expression):
-                tokenString += tokensToString(token.power.tokens)
-            tokenString += ']('
+                tokenString.append(tokensToString(token.power.tokens))
+            tokenString.append('](')
             if isinstance(token.operand, Constant):
-                tokenString += tokensToString([token.operand])
+                tokenString.append(tokensToString([token.operand]))
             elif isinstance(token.operand, Variable):
-                tokenString += tokensToString([token.operand])
+                tokenString.append(tokensToString([token.operand]))
             elif isinstance(token.operand, Expression):
-                tokenString += tokensToString(token.operand.tokens)
-            tokenString += ')'
+                tokenString.append(tokensToString(token.operand.tokens))
+            tokenString.append(')')
         elif isinstance(token, Logarithm):
             if token.coefficient == 1:
                 pass
             elif token.coefficient == -1:
-                tokenString += '-'
+                tokenString.append('-')
             else:
-                tokenString += str(token.coefficient)
+                tokenString.append(str(token.coefficient))
             if token.operand is not None:
-                tokenString += token.value
+                tokenString.append(token.value)
                 if token.power != 1:
-                    tokenString += "^" + "(" + str(token.power) + ")"
-                tokenString += "(" + tokensToString([token.operand]) + ")"
+                    tokenString.append("^" + "(" + str(token.power) + ")")
+                tokenString.append("(" + tokensToString([token.operand]) + ")")
         elif isinstance(token, Trigonometric):
             if token.coefficient == 1:
                 pass
             elif token.coefficient == -1:
-                tokenString += '-'
+                tokenString.append('-')
             else:
-                tokenString += str(token.coefficient)
+                tokenString.append(str(token.coefficient))
             if token.operand is not None:
-                tokenString += token.value
+                tokenString.append(token.value)
                 if token.power != 1:
-                    tokenString += "^" + "(" + str(token.power) + ")"
-                tokenString += "(" + tokensToString([token.operand]) + ")"
+                    tokenString.append("^" + "(" + str(token.power) + ")")
+                tokenString.append("(" + tokensToString([token.operand]) + ")")
         elif isinstance(token, Matrix):
-            tokenString += "["
+            rows = []
             for i in range(token.dim[0]):
-                for j in range(token.dim[1]):
-                    tokenString += tokensToString(token.value[i][j])
-                    tokenString += ","
-                tokenString = tokenString[:-1] + ";"
-            tokenString = tokenString[:-1] + "]"
+                rows.append(",".join(tokensToString(token.value[i][j]) for j in range(token.dim[1])))
+            tokenString.append("[" + ";".join(rows) + "]")
 
-    return tokenString
+    return ''.join(tokenString)
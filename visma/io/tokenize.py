@@ -14,6 +14,7 @@ Logic Description:
 
 import math
 import copy
+import re
 from visma.io.checks import isNumber, isVariable, getNumber, checkEquation, funcs, funcSyms
 from visma.functions.structure import Function, Equation, Expression
 from visma.functions.constant import Constant
@@ -39,6 +40,11 @@ funcTwoLetters = ["ln", "pi"]
 inputLaTeX = ['\\times', '\\div', '+', '-', '=', '^', '\\sqrt']
 inputGreek = ['*', '/', '+', '-', '=', '^', 'sqrt']
 
+# Compiled once, alternatives are tried in order so longer function names win over their prefixes, unmatched characters are skipped
+termPattern = re.compile('|'.join([re.escape(func) for func in funcFourLetters + funcThreeLetters + funcTwoLetters] +
+                                  [r'[a-zA-Z' + ''.join(greek) + r']', r'[0-9][0-9.]*', '<=', '>='] +
+                                  [re.escape(symbol) for symbol in symbols if len(symbol) == 1]))
+
 funcTokens = [Logarithm(), Logarithm(), NaturalLog(), Exponential(), Sine(), Cosine(), Tangent(), Cosecant(), Secant(), Cotangent(), ArcSin(), ArcCos(), ArcTan(), Sinh(), Cosh(), Tanh(), ArcSinh(), ArcCosh(), ArcTanh()]
 
 
@@ -64,94 +70,15 @@ def getTerms(eqn):
     Returns:
         terms {list} -- list of terms{strings}
     """
-    x = 0
     terms = []
-    while x < len(eqn):
-
-        if ('a' <= eqn[x] <= 'z') or ('A' <= eqn[x] <= 'Z') or eqn[x] in greek:
-
-            buf = eqn[x]
-            if x + 3 < len(eqn):
-                for i in range(1, 4):
-                    buf += eqn[x+i]
-            if len(buf) == 4:
-                if buf in funcFourLetters:
-                    terms.append(buf)
-                    x += 4
-                    continue
-
-            buf = eqn[x]
-            if x + 2 < len(eqn):
-                for i in range(1, 3):
-                    buf += eqn[x + i]
-            if len(buf) == 3:
-                if buf in funcThreeLetters:
-                    terms.append(buf)
-                    x += 3
-                    continue
-
-            buf = eqn[x]
-            if x + 1 < len(eqn):
-                buf += eqn[x + 1]
-            if len(buf) == 2:
-                if buf in funcTwoLetters:
-                    terms.append(buf)
-                    x += 2
-                    continue
-
-            if eqn[x] == 'e':   # Special Cases: e , i
-                terms.append("exp")
-                x += 1
-                continue
-            elif eqn[x] == 'i':
-                terms.append("iota")
-                x += 1
-                continue
-
-            terms.append(eqn[x])
-            x += 1
-
-        elif '0' <= eqn[x] <= '9':
-            buf = eqn[x]
-            x += 1
-            while x < len(eqn):
-                if '0' <= eqn[x] <= '9' or eqn[x] == '.':
-                    buf += eqn[x]
-                    x += 1
-                else:
-                    break
-            terms.append(buf)
-
-        elif eqn[x] in symbols:
-            if eqn[x] == '<':
-                i = x
-                buf = eqn[x]
-                while (i - x) < len("="):
-                    i += 1
-                    if i < len(eqn):
-                        buf += eqn[i]
-                if buf == '<=':
-                    terms.append(buf)
-                    x = i + 1
-                    continue
-                terms.append(eqn[x])
-            elif eqn[x] == '>':
-                i = x
-                buf = eqn[x]
-                while (i - x) < len("="):
-                    i += 1
-                    if i < len(eqn):
-                        buf += eqn[i]
-                if buf == '>=':
-                    terms.append(buf)
-                    x = i + 1
-                    continue
-                terms.append(eqn[x])
-            else:
-                terms.append(eqn[x])
-            x += 1
+    for match in termPattern.finditer(eqn):
+        term = match.group()
+        if term == 'e':     # Special Cases: e , i
+            terms.append("exp")
+        elif term == 'i':
+            terms.append("iota")
         else:
-            x += 1
+            terms.append(term)
     return terms
 
 
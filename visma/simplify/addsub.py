@@ -1,7 +1,7 @@
 import copy
 from visma.io.parser import tokensToString
 from visma.io.checks import getLevelVariables, getOperationsEquation, getOperationsExpression, postSimplification
-from visma.functions.structure import Function, Expression
+from visma.functions.structure import Function, Expression, snapshotTokens
 from visma.functions.constant import Constant, Zero
 from visma.functions.variable import Variable
 from visma.functions.operator import Binary
@@ -27,7 +27,7 @@ def addition(tokens, direct=False):
         comments {list} -- list of comments in equation solving process
     """
 
-    animation = [copy.deepcopy(tokens)]
+    animation = [snapshotTokens(tokens)]
     variables = []
     comments = []
     if direct:
@@ -40,7 +40,7 @@ def addition(tokens, direct=False):
         tokens = changeToken(removeToken(tok, rem), change)
         if not tokens:
             tokens.append(Zero())
-        animation.append(copy.deepcopy(tokens))
+        animation.append(snapshotTokens(tokens, animation))
         comments.append(com)
         variables = getLevelVariables(tokens)
         availableOperations = getOperationsExpression(variables, tokens)
@@ -84,7 +84,7 @@ def additionEquation(lToks, rToks, direct=False):
         animBuilder.append(zero)
     else:
         animBuilder.extend(rToks)
-    animation.append(copy.deepcopy(animBuilder))
+    animation.append(snapshotTokens(animBuilder, animation))
     lVariables = []
     lVariables.extend(getLevelVariables(lTokens))
     rVariables = []
@@ -94,7 +94,7 @@ def additionEquation(lToks, rToks, direct=False):
         _, tok, rem, change, com = expressionAddition(lVariables, lTokens)
         lTokens = changeToken(removeToken(tok, rem), change)
         comments.append(com)
-        animBuilder = copy.deepcopy(lTokens)
+        animBuilder = list(lTokens)
         lenToks = len(lTokens)
         equalTo = Binary()
         equalTo.scope = [lenToks]
@@ -106,7 +106,7 @@ def additionEquation(lToks, rToks, direct=False):
             animBuilder.append(zero)
         else:
             animBuilder.extend(rTokens)
-        animation.append(copy.deepcopy(animBuilder))
+        animation.append(snapshotTokens(animBuilder, animation))
         lVariables = getLevelVariables(lTokens)
         availableOperations = getOperationsExpression(lVariables, lTokens)
 
@@ -115,7 +115,7 @@ def additionEquation(lToks, rToks, direct=False):
         _, tok, rem, change, com = expressionAddition(rVariables, rTokens)
         rTokens = changeToken(removeToken(tok, rem), change)
         comments.append(com)
-        animBuilder = copy.deepcopy(lTokens)
+        animBuilder = list(lTokens)
         lenToks = len(lTokens)
         equalTo = Binary()
         equalTo.scope = [lenToks]
@@ -127,7 +127,7 @@ def additionEquation(lToks, rToks, direct=False):
             animBuilder.append(zero)
         else:
             animBuilder.extend(rTokens)
-        animation.append(copy.deepcopy(animBuilder))
+        animation.append(snapshotTokens(animBuilder, animation))
         rVariables = getLevelVariables(rTokens)
         availableOperations = getOperationsExpression(rVariables, rTokens)
 
@@ -139,7 +139,7 @@ def additionEquation(lToks, rToks, direct=False):
         rTokens = changeToken(removeToken(rTokens, rRemoveScopes), rChange)
         lTokens = changeToken(removeToken(lTokens, lRemoveScopes), lChange)
         comments.append(com)
-        animBuilder = copy.deepcopy(lTokens)
+        animBuilder = list(lTokens)
         lenToks = len(lTokens)
         equalTo = Binary()
         equalTo.scope = [lenToks]
@@ -151,7 +151,7 @@ def additionEquation(lToks, rToks, direct=False):
             animBuilder.append(zero)
         else:
             animBuilder.extend(rTokens)
-        animation.append(copy.deepcopy(animBuilder))
+        animation.append(snapshotTokens(animBuilder, animation))
         lVariables = getLevelVariables(lTokens)
         rVariables = getLevelVariables(rTokens)
         availableOperations = getOperationsEquation(
@@ -576,7 +576,7 @@ def subtraction(tokens, direct=False):
         comments {list} -- list of comments in equation solving process
     """
 
-    animation = [copy.deepcopy(tokens)]
+    animation = [snapshotTokens(tokens)]
     comments = []
     if direct:
         comments = [[]]
@@ -588,7 +588,7 @@ def subtraction(tokens, direct=False):
         tokens = changeToken(removeToken(tok, rem), change)
         if not tokens:
             tokens.append(Zero())
-        animation.append(copy.deepcopy(tokens))
+        animation.append(snapshotTokens(tokens, animation))
         comments.append(com)
         variables = getLevelVariables(tokens)
         availableOperations = getOperationsExpression(variables, tokens)
@@ -631,7 +631,7 @@ def subtractionEquation(lToks, rToks, direct=False):
         animBuilder.append(zero)
     else:
         animBuilder.extend(rToks)
-    animation.append(copy.deepcopy(animBuilder))
+    animation.append(snapshotTokens(animBuilder, animation))
     lVariables = []
     lVariables.extend(getLevelVariables(lTokens))
     rVariables = []
@@ -642,7 +642,7 @@ def subtractionEquation(lToks, rToks, direct=False):
             lVariables, lTokens)
         lTokens = changeToken(removeToken(tok, rem), change)
         comments.append(com)
-        animBuilder = copy.deepcopy(lTokens)
+        animBuilder = list(lTokens)
         lenToks = len(lTokens)
         equalTo = Binary()
         equalTo.scope = [lenToks]
@@ -654,7 +654,7 @@ def subtractionEquation(lToks, rToks, direct=False):
             animBuilder.append(zero)
         else:
             animBuilder.extend(rTokens)
-        animation.append(copy.deepcopy(animBuilder))
+        animation.append(snapshotTokens(animBuilder, animation))
         lVariables = getLevelVariables(lTokens)
         availableOperations = getOperationsExpression(lVariables, lTokens)
 
@@ -664,7 +664,7 @@ def subtractionEquation(lToks, rToks, direct=False):
             rVariables, rTokens)
         rTokens = changeToken(removeToken(tok, rem), change)
         comments.append(com)
-        animBuilder = copy.deepcopy(lTokens)
+        animBuilder = list(lTokens)
         lenToks = len(lTokens)
         equalTo = Binary()
         equalTo.scope = [lenToks]
@@ -676,7 +676,7 @@ def subtractionEquation(lToks, rToks, direct=False):
             animBuilder.append(zero)
         else:
             animBuilder.extend(rTokens)
-        animation.append(copy.deepcopy(animBuilder))
+        animation.append(snapshotTokens(animBuilder, animation))
         rVariables = getLevelVariables(rTokens)
         availableOperations = getOperationsExpression(rVariables, rTokens)
 
@@ -688,7 +688,7 @@ def subtractionEquation(lToks, rToks, direct=False):
         rTokens = changeToken(removeToken(rTokens, rRemoveScopes), rChange)
         lTokens = changeToken(removeToken(lTokens, lRemoveScopes), lChange)
         comments.append(com)
-        animBuilder = copy.deepcopy(lTokens)
+        animBuilder = list(lTokens)
         lenToks = len(lTokens)
         equalTo = Binary()
         equalTo.scope = [lenToks]
@@ -700,7 +700,7 @@ def subtractionEquation(lToks, rToks, direct=False):
             animBuilder.append(zero)
         else:
             animBuilder.extend(rTokens)
-        animation.append(copy.deepcopy(animBuilder))
+        animation.append(snapshotTokens(animBuilder, animation))
         lVariables = getLevelVariables(lTokens)
         rVariables = getLevelVariables(rTokens)
         availableOperations = getOperationsEquation(
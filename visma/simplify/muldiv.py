@@ -1,6 +1,7 @@
 import copy
 from visma.io.parser import tokensToString
 from visma.io.checks import getLevelVariables, getOperationsEquation, getOperationsExpression
+from visma.functions.structure import snapshotTokens
 from visma.functions.constant import Constant, Zero
 from visma.functions.variable import Variable
 from visma.functions.operator import Binary
@@ -26,7 +27,7 @@ def multiplication(tokens, direct=False):
         comments {list} -- list of comments in equation solving process
     """
 
-    animation = [copy.deepcopy(tokens)]
+    animation = [snapshotTokens(tokens)]
     comments = []
     if direct:
         comments = [[]]
@@ -37,7 +38,7 @@ def multiplication(tokens, direct=False):
         _, tok, rem, com = expressionMultiplication(variables, tokens)
         tokens = removeToken(tok, rem)
         comments.append(com)
-        animation.append(copy.deepcopy(tokens))
+        animation.append(snapshotTokens(tokens, animation))
         variables = getLevelVariables(tokens)
         availableOperations = getOperationsExpression(variables, tokens)
     token_string = tokensToString(tokens)
@@ -127,7 +128,7 @@ def multiplicationEquation(lToks, rToks, direct=False):
         animBuilder.append(zero)
     else:
         animBuilder.extend(rToks)
-    animation.append(copy.deepcopy(animBuilder))
+    animation.append(snapshotTokens(animBuilder, animation))
     lVariables = []
     lVariables.extend(getLevelVariables(lTokens))
     rVariables = []
@@ -137,7 +138,7 @@ def multiplicationEquation(lToks, rToks, direct=False):
         _, tok, rem, com = expressionMultiplication(lVariables, lTokens)
         lTokens = removeToken(tok, rem)
         comments.append(com)
-        animBuilder = copy.deepcopy(lTokens)
+        animBuilder = list(lTokens)
         lenToks = len(lTokens)
         equalTo = Binary()
         equalTo.scope = [lenToks]
@@ -149,7 +150,7 @@ def multiplicationEquation(lToks, rToks, direct=False):
             animBuilder.append(zero)
         else:
             animBuilder.extend(rTokens)
-        animation.append(copy.deepcopy(animBuilder))
+        animation.append(snapshotTokens(animBuilder, animation))
         lVariables = getLevelVariables(lTokens)
         availableOperations = getOperationsExpression(lVariables, lTokens)
 
@@ -158,7 +159,7 @@ def multiplicationEquation(lToks, rToks, direct=False):
         _, tok, rem, com = expressionMultiplication(rVariables, rTokens)
         rTokens = removeToken(tok, rem)
         comments.append(com)
-        animBuilder = copy.deepcopy(lTokens)
+        animBuilder = list(lTokens)
         lenToks = len(lTokens)
         equalTo = Binary()
         equalTo.scope = [lenToks]
@@ -170,7 +171,7 @@ def multiplicationEquation(lToks, rToks, direct=False):
             animBuilder.append(zero)
         else:
             animBuilder.extend(rTokens)
-        animation.append(copy.deepcopy(animBuilder))
+        animation.append(snapshotTokens(animBuilder, animation))
         rVariables = getLevelVariables(rTokens)
         availableOperations = getOperationsExpression(rVariables, rTokens)
 
@@ -213,7 +214,7 @@ def division(tokens, direct=False):
         comments {list} -- list of comments in equation solving process
     """
 
-    animation = [copy.deepcopy(tokens)]
+    animation = [snapshotTokens(tokens)]
     comments = []
     if direct:
         comments = [[]]
@@ -224,7 +225,7 @@ def division(tokens, direct=False):
         _, tok, rem, com = expressionDivision(variables, tokens)
         tokens = removeToken(tok, rem)
         comments.append(com)
-        animation.append(copy.deepcopy(tokens))
+        animation.append(snapshotTokens(tokens, animation))
         variables = getLevelVariables(tokens)
         availableOperations = getOperationsExpression(variables, tokens)
     token_string = tokensToString(tokens)
@@ -314,7 +315,7 @@ def divisionEquation(lToks, rToks, direct=False):
         animBuilder.append(zero)
     else:
         animBuilder.extend(rToks)
-    animation.append(copy.deepcopy(animBuilder))
+    animation.append(snapshotTokens(animBuilder, animation))
     lVariables = []
     lVariables.extend(getLevelVariables(lTokens))
     rVariables = []
@@ -324,7 +325,7 @@ def divisionEquation(lToks, rToks, direct=False):
         _, tok, rem, com = expressionDivision(lVariables, lTokens)
         lTokens = removeToken(tok, rem)
         comments.append(com)
-        animBuilder = copy.deepcopy(lTokens)
+        animBuilder = list(lTokens)
         lenToks = len(lTokens)
         equalTo = Binary()
         equalTo.scope = [lenToks]
@@ -336,7 +337,7 @@ def divisionEquation(lToks, rToks, direct=False):
             animBuilder.append(zero)
         else:
             animBuilder.extend(rTokens)
-        animation.append(copy.deepcopy(animBuilder))
+        animation.append(snapshotTokens(animBuilder, animation))
         lVariables = getLevelVariables(lTokens)
         availableOperations = getOperationsExpression(lVariables, lTokens)
 
@@ -345,7 +346,7 @@ def divisionEquation(lToks, rToks, direct=False):
         _, tok, rem, com = expressionDivision(rVariables, rTokens)
         rTokens = removeToken(tok, rem)
         comments.append(com)
-        animBuilder = copy.deepcopy(lTokens)
+        animBuilder = list(lTokens)
         lenToks = len(lTokens)
         equalTo = Binary()
         equalTo.scope = [lenToks]
@@ -357,7 +358,7 @@ def divisionEquation(lToks, rToks, direct=False):
             animBuilder.append(zero)
         else:
             animBuilder.extend(rTokens)
-        animation.append(copy.deepcopy(animBuilder))
+        animation.append(snapshotTokens(animBuilder, animation))
         rVariables = getLevelVariables(rTokens)
         availableOperations = getOperationsExpression(rVariables, rTokens)
 
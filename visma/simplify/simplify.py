@@ -10,16 +10,108 @@ Logic Description:
 """
 
 import copy
+from collections import OrderedDict
+from functools import lru_cache
+from visma.config.values import SIMPLIFY_CACHE_SIZE
 from visma.functions.constant import Constant, Zero
 from visma.functions.variable import Variable
 from visma.functions.operator import Binary
 from visma.functions.trigonometry import Trigonometric
-from visma.io.checks import isEquation, getLevelVariables, getOperationsEquation, getOperationsExpression, postSimplification
+from visma.io.checks import isEquation, isNumber, getNumber, getLevelVariables, getOperationsEquation, getOperationsExpression, postSimplification
 from visma.io.parser import tokensToString
 from visma.io.tokenize import tokenizer
 from visma.simplify.addsub import addition, additionEquation, subtraction, subtractionEquation
 from visma.simplify.muldiv import multiplication, multiplicationEquation, division, divisionEquation
-from visma.functions.structure import Expression
+from visma.functions.structure import Expression, cloneValue, snapshotTokens
+
+# Results of already simplified token lists, keyed on their string representation
+expressionCache = OrderedDict()
+simplifificationCache = OrderedDict()
+
+SIGN_FLIP = {'+': '-', '-': '+'}
+
+# Operations in the order they are applied, each kernel hands back the operations still available after it
+EXPRESSION_KERNELS = [('/', division), ('*', multiplication), ('+', addition), ('-', subtraction)]
+EQUATION_KERNELS = [('/', divisionEquation), ('*', multiplicationEquation), ('+', additionEquation), ('-', subtractionEquation)]
+
+
+def dispatchKernel(kernels, availableOperations):
+    """Returns the kernel of the first operation which can be performed
+
+    Arguments:
+        kernels {list} -- (operation, kernel) pairs in order of priority
+        availableOperations {list} -- list of operations which can be performed
+
+    Returns:
+        kernel {function} -- kernel to be applied or None if no operation can be performed
+    """
+    # At most four probes of a short list, folding the list into a bitmask first costs more than that
+    for op, kernel in kernels:
+        if op in availableOperations:
+            return kernel
+    return None
+
+
+def cacheLookup(cache, key):
+    """Returns a copy of the result stored for the key in the cache
+
+    Arguments:
+        cache {OrderedDict} -- cache of simplified results
+        key {hashable} -- key of the simplified tokens
+
+    Returns:
+        result {object} -- copy of the cached result or None if not found
+    """
+    if key not in cache:
+        return None
+    cache.move_to_end(key)
+    return cloneValue(cache[key])
+
+
+def cacheStore(cache, key, result):
+    """Stores a copy of the result in the cache, evicting the least recently used entry when full
+
+    Arguments:
+        cache {OrderedDict} -- cache of simplified results
+        key {hashable} -- key of the simplified tokens
+        result {object} -- simplified result
+    """
+    cache[key] = cloneValue(result)
+    cache.move_to_end(key)
+    if len(cache) > SIMPLIFY_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+@lru_cache(maxsize=None)
+def equalToToken(scope):
+    """Returns the interned '=' token for the given scope
+
+    Interned tokens are shared between all the equations built by this module, hence should never be mutated.
+
+    Arguments:
+        scope {int} -- position of the '=' token in the equation
+
+    Returns:
+        equalTo {visma.functions.operator.Binary} -- '=' token
+    """
+    equalTo = Binary('=')
+    equalTo.scope = [scope]
+    return equalTo
+
+
+@lru_cache(maxsize=None)
+def zeroToken(scope):
+    """Returns the interned Zero token for the given scope
+
+    Arguments:
+        scope {int} -- position of the Zero token in the equation
+
+    Returns:
+        zero {visma.functions.constant.Zero} -- Zero token
+    """
+    zero = Zero()
+    zero.scope = [scope]
+    return zero
 
 
 def moveRTokensToLTokens(lTokens, rTokens):
@@ -38,77 +130,80 @@ def moveRTokensToLTokens(lTokens, rTokens):
     elif isEquation(lTokens, rTokens):
         return lTokens, rTokens
     elif len(lTokens) != 0:
-        for i, token in enumerate(rTokens):
-            if i == 0 and not isinstance(token, Binary):
-                binary = Binary()
-                binary.value = '-'
-                binary.scope = copy.copy(token.scope)
-                binary.scope[-1] -= 1
-                lTokens.append(binary)
-            if isinstance(token, Binary):
-                if token.value in ['+', '-']:
-                    if token.value == '-':
-                        token.value = '+'
-                    else:
-                        token.value = '-'
-            elif isinstance(token, Constant):
-                if token.value < 0:
-                    if isinstance(lTokens[-1], Binary):
-                        if lTokens[-1].value == '-':
-                            token.value *= -1
-                            lTokens[-1].value = '+'
-                        elif lTokens[-1].value == '+':
-                            token.value *= -1
-                            lTokens[-1].value = '-'
-            elif isinstance(token, Variable):
-                if token.coefficient < 0:
-                    if isinstance(lTokens[-1], Binary):
-                        if lTokens[-1].value == '-':
-                            token.coefficient *= -1
-                            lTokens[-1].value = '+'
-                        elif lTokens[-1].value == '+':
-                            token.coefficient *= -1
-                            lTokens[-1].value = '-'
-            lTokens.append(token)
+        # Flip the signs of RHS in one pass, then fold the negative terms into the sign before them in another
+        for token in rTokens:
+            if isinstance(token, Binary) and token.value in SIGN_FLIP:
+                token.value = SIGN_FLIP[token.value]
+        if len(rTokens) > 0 and not isinstance(rTokens[0], Binary):
+            binary = Binary()
+            binary.value = '-'
+            binary.scope = copy.copy(rTokens[0].scope)
+            binary.scope[-1] -= 1
+            lTokens.append(binary)
+        start = len(lTokens)
+        lTokens.extend(rTokens)
+        for i in range(start, len(lTokens)):
+            token = lTokens[i]
+            sign = lTokens[i - 1]
+            if not (isinstance(sign, Binary) and sign.value in SIGN_FLIP):
+                continue
+            if isinstance(token, Constant) and token.value < 0:
+                token.value *= -1
+                sign.value = SIGN_FLIP[sign.value]
+            elif isinstance(token, Variable) and token.coefficient < 0:
+                token.coefficient *= -1
+                sign.value = SIGN_FLIP[sign.value]
     rTokens = []
     return lTokens, rTokens
 
 
-def equationAnimationBuilder(lTokens, rTokens):
+def equationBuilder(lTokens, rTokens):
+    """Given LHS & RHS tokens for an equation it builds the tokens of complete equation, sharing the given tokens
+
+    Arguments:
+        lTokens {list} -- Tokens of LHS
+        rTokens {list} -- Tokens of RHS
+
+    Returns:
+        eqnBuilder {list} -- list of tokens of complete equation
+    """
+    eqnBuilder = list(lTokens)
+    lenToks = len(lTokens)
+    eqnBuilder.append(equalToToken(lenToks))
+    if len(rTokens) == 0:
+        eqnBuilder.append(zeroToken(lenToks + 1))
+    else:
+        eqnBuilder.extend(rTokens)
+    return eqnBuilder
+
+
+def equationAnimationBuilder(lTokens, rTokens, animation=None):
     """Given LHS & RHS tokens for an equation it builds the tokens of complete equation
 
     Arguments:
         lTokens {list} -- Tokens of LHS
         rTokens {list} -- Tokens of RHS
 
+    Keyword Arguments:
+        animation {list} -- frames stored so far, unchanged tokens of the last one are shared (default: {None})
+
     Returns:
         animBulder {list} -- list of tokens of complete equation
     """
-    animBuilder = []
-    lToks = copy.deepcopy(lTokens)
-    rToks = copy.deepcopy(rTokens)
-    animBuilder = lToks
-    lenToks = len(lToks)
-    equalTo = Binary()
-    equalTo.scope = [lenToks]
-    equalTo.value = '='
-    animBuilder.append(equalTo)
-    if len(rToks) == 0:
-        zero = Zero()
-        zero.scope = [lenToks + 1]
-        animBuilder.append(zero)
-    else:
-        animBuilder.extend(rToks)
+    animBuilder = snapshotTokens(equationBuilder(lTokens, rTokens), animation)
     return animBuilder
 
 
-def simplifyEquation(lToks, rToks):
+def simplifyEquation(lToks, rToks, *, animate=True):
     """Simplifies given equation tokens
 
     Arguments:
         lToks {list} -- LHS tokens list
         rToks {list} -- RHS tokens list
 
+    Keyword Arguments:
+        animate {bool} -- False when the caller discards the animation (default: {True})
+
     Returns:
         lTokens {list} -- LHS tokens list
         rTokens {list} -- RHS tokens list
@@ -117,81 +212,52 @@ def simplifyEquation(lToks, rToks):
         animation {list} -- list of equation simplification progress
         comments {list} -- list of solution steps
     """
-    lTokens = copy.deepcopy(lToks)
-    rTokens = copy.deepcopy(rToks)
     animation = []
     comments = []
     comments += [[]]
-    animation.append(equationAnimationBuilder(lTokens, rTokens))
-    lTokens = copy.deepcopy(lToks)
-    rTokens = copy.deepcopy(rToks)
+    if animate:
+        animation.append(equationAnimationBuilder(lToks, rToks))
+    lTokens = [cloneValue(token) for token in lToks]
+    rTokens = [cloneValue(token) for token in rToks]
     expressionPresent = False
     for toks in lTokens:
         if isinstance(toks, Expression):
             expressionPresent = True
     if expressionPresent:
-        lTokens, _, _, _, _ = expressionSimplification(lTokens, [], lTokens)
+        lTokens, _, _, _, _ = expressionSimplification(lTokens, [], lTokens, animate=False)
         comments += [['Opening brackets in the LHS']]
-        animation.append(equationAnimationBuilder(lTokens, rTokens))
+        if animate:
+            animation.append(equationAnimationBuilder(lTokens, rTokens, animation))
     expressionPresent = False
     for toks in rTokens:
         if isinstance(toks, Expression):
             expressionPresent = True
     if expressionPresent:
-        rTokens, _, _, _, _ = expressionSimplification(rTokens, [], rTokens)
+        rTokens, _, _, _, _ = expressionSimplification(rTokens, [], rTokens, animate=False)
         comments += [['Opening brackets in the RHS']]
-        animation.append(equationAnimationBuilder(lTokens, rTokens))
-    lVariables = []
-    lVariables.extend(getLevelVariables(lTokens))
-    rVariables = []
-    rVariables.extend(getLevelVariables(rTokens))
+        if animate:
+            animation.append(equationAnimationBuilder(lTokens, rTokens, animation))
+    lVariables = getLevelVariables(lTokens)
+    rVariables = getLevelVariables(rTokens)
     availableOperations = getOperationsEquation(lVariables, lTokens, rVariables, rTokens)
+    # Each of the equation operations hands back the operations left on its resulting tokens
     while len(availableOperations) > 0:
-        if '/' in availableOperations:
-            lTokens, rTokens, availableOperations, token_string, anim, com = divisionEquation(
-                lTokens, rTokens)
-            animation.pop(len(animation) - 1)
-            animation.extend(anim)
-            comments.extend(com)
-        elif '*' in availableOperations:
-            lTokens, rTokens, availableOperations, token_string, anim, com = multiplicationEquation(
-                lTokens, rTokens)
-            animation.pop(len(animation) - 1)
-            animation.extend(anim)
-            comments.extend(com)
-        elif '+' in availableOperations:
-            lTokens, rTokens, availableOperations, token_string, anim, com = additionEquation(
-                lTokens, rTokens)
-            animation.pop(len(animation) - 1)
-            animation.extend(anim)
-            comments.extend(com)
-        elif '-' in availableOperations:
-            lTokens, rTokens, availableOperations, token_string, anim, com = subtractionEquation(
-                lTokens, rTokens)
+        kernel = dispatchKernel(EQUATION_KERNELS, availableOperations)
+        if kernel is None:
+            break
+        lTokens, rTokens, availableOperations, token_string, anim, com = kernel(lTokens, rTokens)
+        if animate:
             animation.pop(len(animation) - 1)
             animation.extend(anim)
-            comments.extend(com)
-        lVariables = getLevelVariables(lTokens)
-        rVariables = getLevelVariables(rTokens)
-        availableOperations = getOperationsEquation(lVariables, lTokens, rVariables, rTokens)
+        comments.extend(com)
     moved = False
     if len(rTokens) > 0:
         moved = True
         lTokens, rTokens = moveRTokensToLTokens(lTokens, rTokens)
-    tokenToStringBuilder = copy.deepcopy(lTokens)
-    lenToks = len(lTokens)
-    equalTo = Binary()
-    equalTo.scope = [lenToks]
-    equalTo.value = '='
-    tokenToStringBuilder.append(equalTo)
-    if len(rTokens) == 0:
-        zero = Zero()
-        zero.scope = [lenToks + 1]
-        tokenToStringBuilder.append(zero)
-    else:
-        tokenToStringBuilder.extend(rTokens)
+    tokenToStringBuilder = equationBuilder(lTokens, rTokens)
     if moved:
-        animation.append(copy.deepcopy(tokenToStringBuilder))
+        if animate:
+            animation.append(equationAnimationBuilder(lTokens, rTokens, animation))
         comments.append(['Moving the rest of variables/constants to LHS'])
     token_string = tokensToString(tokenToStringBuilder)
     return lTokens, rTokens, availableOperations, token_string, animation, comments
@@ -212,16 +278,76 @@ def simplify(tokens):
         comments {list} -- list of comments in equation solving process
 
     """
-    tokens_orig = copy.deepcopy(tokens)
+    tokens_orig = [cloneValue(token) for token in tokens]
     animation = [tokens_orig]
     comments = [[]]
+    # Flat terms which no operation or pruning can change are already simplified
+    normalTokens = normalizeTokens(tokens)
+    if normalTokens is not None and pruneIdentities(normalTokens) == normalTokens:
+        availableOperations = getOperationsExpression(getLevelVariables(normalTokens), normalTokens)
+        if not availableOperations:
+            return normalTokens, availableOperations, tokensToString(normalTokens), animation, comments
     tokens, availableOperations, token_string, anim1, comment1 = expressionSimplification(tokens_orig, [], tokens)
     animation.extend(anim1)
     comments.extend(comment1)
     return tokens, availableOperations, token_string, animation, comments
 
 
-def expressionSimplification(tokens_now, scope, tokens1):
+def simplifyInnerExpression(tokens_now, scope, expression, position):
+    """Simplifies the tokens of a nested Expression in place, unless they are already simplified
+
+    Arguments:
+        tokens_now {list} -- list of original tokens as function gets called recursively
+        scope {list} -- integers (bounds) indicating which Expression we are currently solving
+        expression {visma.functions.structure.Expression} -- nested Expression
+        position {int} -- position of the Expression in the current tokens
+    """
+    if not expression.simplified:
+        scope.append(position)
+        expression.tokens, _, _, _, _ = expressionSimplification(tokens_now, scope, expression.tokens, animate=False)
+        expression.simplified = True
+
+
+def normalizeTokens(tokens):
+    """Brings a flat list of terms to the form the tokenizer would give for its string, without going through the string
+
+    Terms are cloned, numbers are rounded like getNumber does and scopes are renumbered.
+    Lists which the tokenizer would regroup (leading or repeated operators, Constants with
+    a power, Expressions, functions) are not handled.
+
+    Arguments:
+        tokens {list} -- list of function tokens
+
+    Returns:
+        normalTokens {list} -- normalized copy of tokens, None if tokens is not a flat list of terms
+    """
+    normalTokens = []
+    for i, token in enumerate(tokens):
+        if i % 2 == 1:
+            if not isinstance(token, Binary) or token.value not in ['+', '-', '*', '/']:
+                return None
+            token = Binary(token.value)
+        elif type(token) is Constant:
+            if not isNumber(token.value) or token.power != 1:
+                return None
+            token = token.clone()
+            token.value = getNumber(token.value)
+        elif type(token) is Variable:
+            if not isinstance(token.value, list) or not isNumber(token.coefficient) or not all(isNumber(power) for power in token.power):
+                return None
+            token = token.clone()
+            token.coefficient = 1 if token.coefficient == 1 else getNumber(token.coefficient)
+            token.power = [1 if power == 1 else getNumber(power) for power in token.power]
+        else:
+            return None
+        token.scope = [i]
+        normalTokens.append(token)
+    if normalTokens and isinstance(normalTokens[-1], Binary):
+        return None
+    return normalTokens
+
+
+def expressionSimplification(tokens_now, scope, tokens1, *, animate=True):
     '''Makes an input equation free from Expressions, i.e. solving each Expression recursively to convert them in other tokens.
 
     Arguments:
@@ -229,6 +355,9 @@ def expressionSimplification(tokens_now, scope, tokens1):
         scope {list} -- integers (bounds) indicating which Expression we are currently solving
         tokens1 {list} -- list of current tokens as function gets called recursively
 
+    Keyword Arguments:
+        animate {bool} -- False when the caller discards the animation (default: {True})
+
     Returns:
         simToks {list} -- list of simplified tokens of each Expression
         availableOperations {list} -- list of operations which can be performed on a equation token
@@ -236,6 +365,15 @@ def expressionSimplification(tokens_now, scope, tokens1):
         animation {list} -- list of equation solving process
         comments {list} -- list of comments in equation solving process
     '''
+    # Nested Expressions only give back their tokens, so those can be looked up from the cache
+    cacheKey = None
+    if scope:
+        cacheKey = (tokensToString(tokens1), len(scope))
+        cached = cacheLookup(expressionCache, cacheKey)
+        if cached is not None:
+            scope.pop()
+            return cached, '', '', [], []
+        scopeRest = scope[:-1]
     animation = []
     comments = []
     pfTokens = []
@@ -244,9 +382,9 @@ def expressionSimplification(tokens_now, scope, tokens1):
         if (i + 1 < len(tokens1)):
             if isinstance(tokens1[i], Binary) and tokens1[i].value == '^':
                 if isinstance(tokens1[i - 1], Expression):
-                    tokens1[i - 1].tokens, _, _, _, _ = expressionSimplification(tokens_now, scope, tokens1[i - 1].tokens)
+                    tokens1[i - 1].tokens, _, _, _, _ = expressionSimplification(tokens_now, scope, tokens1[i - 1].tokens, animate=False)
                 if isinstance(tokens1[i + 1], Expression):
-                    tokens1[i + 1].tokens, _, _, _, _ = expressionSimplification(tokens_now, scope, tokens1[i + 1].tokens)
+                    tokens1[i + 1].tokens, _, _, _, _ = expressionSimplification(tokens_now, scope, tokens1[i + 1].tokens, animate=False)
                     if len(tokens1[i + 1].tokens) == 1 and isinstance(tokens1[i + 1].tokens[0], Constant):
                         tokens1[i + 1] = Constant(tokens1[i + 1].tokens[0].calculate(), 1, 1)
             if (isinstance(tokens1[i], Binary) and tokens1[i].value == '^') and isinstance(tokens1[i + 1], Constant):
@@ -262,51 +400,45 @@ def expressionSimplification(tokens_now, scope, tokens1):
         else:
             pfTokens.append(tokens1[i])
         i += 1
-    tokens1 = copy.deepcopy(pfTokens)
-    animation.append(pfTokens)
+    tokens1 = [cloneValue(token) for token in pfTokens]
+    if animate:
+        animation.append(pfTokens)
     comments.append(['Expanding the powers of expressions'])
     mulFlag = True
     expressionMultiplication = False
     # Check for the case: {Non-Expression} * {Expression}
-    for _ in range(50):
-        for i, _ in enumerate(tokens1):
-            mulFlag = False
-            if isinstance(tokens1[i], Expression):
-                if (i > 1):
-                    if (tokens1[i - 1].value == '*'):
-                        scope.append(i)
-                        tokens1[i].tokens, _, _, _, _ = expressionSimplification(tokens_now, scope, tokens1[i].tokens)
-                        if isinstance(tokens1[i - 2], Expression):
-                            scope.append(i - 2)
-                            tokens1[i - 2].tokens, _, _, _, _ = expressionSimplification(tokens_now, scope, tokens1[i - 2].tokens)
-                        a = tokens1[i - 2]
-                        b = tokens1[i]
-                        c = a * b
-                        mulFlag = True
-                        expressionMultiplication = True
-                        if isinstance(c, Expression):
-                            scope.append(i)
-                            c.tokens, _, _, _, _ = expressionSimplification(tokens_now, scope, c.tokens)
-                        tokens1[i] = c
-                        del tokens1[i - 1]
-                        del tokens1[i - 2]
-                        break
+    # Single left to right pass, products are folded into the last operand on the stack
+    mulTokens = []
+    for token in tokens1:
+        while isinstance(token, Expression) and len(mulTokens) > 1 and mulTokens[-1].value == '*':
+            simplifyInnerExpression(tokens_now, scope, token, len(mulTokens))
+            if isinstance(mulTokens[-2], Expression):
+                simplifyInnerExpression(tokens_now, scope, mulTokens[-2], len(mulTokens) - 2)
+            a = mulTokens[-2]
+            b = token
+            token = a * b
+            expressionMultiplication = True
+            if isinstance(token, Expression):
+                token.simplified = False
+                simplifyInnerExpression(tokens_now, scope, token, len(mulTokens))
+            del mulTokens[-2:]
+        mulTokens.append(token)
+    tokens1 = mulTokens
     trigonometricError = False
     # Check for the case: {Expression} * {Non-Expression}
     if not trigonometricError:
         for _ in range(50):
-            for i, _ in enumerate(tokens1):
+            for i, left in enumerate(tokens1):
                 mulFlag = False
-                if isinstance(tokens1[i], Expression):
+                if isinstance(left, Expression):
                     if i + 2 < len(tokens1):
-                        if (tokens1[i + 1].value == '*'):
-                            scope.append(i)
-                            tokens1[i].tokens, _, _, _, _ = expressionSimplification(tokens_now, scope, tokens1[i].tokens)
-                            if isinstance(tokens1[i + 2], Expression):
-                                scope.append(i + 2)
-                                tokens1[i + 2].tokens, _, _, _, _ = expressionSimplification(tokens_now, scope, tokens1[i + 2].tokens)
-                            a = tokens1[i + 2]
-                            b = tokens1[i]
+                        mid, right = tokens1[i + 1], tokens1[i + 2]
+                        if (mid.value == '*'):
+                            simplifyInnerExpression(tokens_now, scope, left, i)
+                            if isinstance(right, Expression):
+                                simplifyInnerExpression(tokens_now, scope, right, i + 2)
+                            a = right
+                            b = left
                             trigonometricError = False
                             for ec in b.tokens:
                                 if isinstance(ec, Trigonometric):
@@ -317,16 +449,15 @@ def expressionSimplification(tokens_now, scope, tokens1):
                                 mulFlag = True
                                 expressionMultiplication = True
                                 if isinstance(c, Expression):
-                                    scope.append(i)
-                                    c.tokens, _, _, _, _ = expressionSimplification(tokens_now, scope, c.tokens)
-                                tokens1[i] = c
-                                del tokens1[i + 1]
-                                del tokens1[i + 1]
+                                    c.simplified = False
+                                    simplifyInnerExpression(tokens_now, scope, c, i)
+                                tokens1[i:i + 3] = [c]
                                 break
             if not mulFlag:
                 break
     if expressionMultiplication:
-        animation.append(tokens1)
+        if animate:
+            animation.append(tokens1)
         comments.append(['Multiplying expressions'])
     # TODO: Implement verbose multiplication steps.
     simToks = []
@@ -334,35 +465,44 @@ def expressionSimplification(tokens_now, scope, tokens1):
     for i, _ in enumerate(tokens1):
         if isinstance(tokens1[i], Expression):
             expressionPresent = True
-            scope.append(i)
-            newToks, _, _, _, _ = expressionSimplification(tokens_now, scope, tokens1[i].tokens)
+            if tokens1[i].simplified:
+                newToks = [cloneValue(token) for token in tokens1[i].tokens]
+            else:
+                scope.append(i)
+                newToks, _, _, _, _ = expressionSimplification(tokens_now, scope, tokens1[i].tokens, animate=False)
             if not simToks:
-                simToks.extend(newToks)
-            elif (simToks[len(simToks) - 1].value == '+'):
-                if isinstance(newToks[0], Constant):
-                    if (newToks[0].value < 0):
+                simToks = list(newToks)
+            elif (simToks[-1].value == '+'):
+                first = newToks[0]
+                if isinstance(first, Constant):
+                    if (first.value < 0):
                         simToks.pop()
                 simToks.extend(newToks)
-            elif (simToks[len(simToks) - 1].value == '-'):
+            elif (simToks[-1].value == '-'):
                 for _, x in enumerate(newToks):
                     if x.value == '+':
                         x.value = '-'
                     elif x.value == '-':
                         x.value = '+'
-                if (isinstance(newToks[0], Constant)):
-                    if (newToks[0].value < 0):
+                first = newToks[0]
+                if (isinstance(first, Constant)):
+                    if (first.value < 0):
                         simToks[-1].value = '+'
-                        newToks[0].value = abs(newToks[0].value)
-                elif (isinstance(newToks[0], Variable)):
-                    if (newToks[0].coefficient < 0):
+                        first.value = abs(first.value)
+                elif (isinstance(first, Variable)):
+                    if (first.coefficient < 0):
                         simToks[-1].value = '+'
-                        newToks[0].coefficient = abs(newToks[0].coefficient)
+                        first.coefficient = abs(first.coefficient)
                 simToks.extend(newToks)
         else:
-            simToks.extend([tokens1[i]])
-    simToks = tokenizer(tokensToString(simToks))
+            simToks.append(tokens1[i])
+    normalToks = normalizeTokens(simToks)
+    if normalToks is None:
+        normalToks = tokenizer(tokensToString(simToks))
+    simToks = normalToks
     if expressionPresent:
-        animation += [simToks]
+        if animate:
+            animation += [simToks]
         comments += [['Opening up all the brackets']]
 
     # TODO: Implement Trigonometric functions in the simplify module.
@@ -373,9 +513,10 @@ def expressionSimplification(tokens_now, scope, tokens1):
             break
     if not trigonometricError:
         if scope == []:
-            simToks, availableOperations, token_string, animExtra, commentExtra = simplifification(simToks)
-            animExtra.pop(0)
-            animation += animExtra
+            simToks, availableOperations, token_string, animExtra, commentExtra = simplifification(simToks, animate=animate)
+            if animate:
+                animExtra.pop(0)
+                animation += animExtra
             comments += commentExtra
         else:
             availableOperations = ''
@@ -386,15 +527,129 @@ def expressionSimplification(tokens_now, scope, tokens1):
     # TODO: Implement verbose steps in simplification of Expressions (steps shown can be varied depending on length of expression)
     if scope != []:
         scope.pop()
+    if cacheKey is not None and availableOperations == '' and scope == scopeRest:
+        cacheStore(expressionCache, cacheKey, simToks)
     return simToks, availableOperations, token_string, animation, comments
 
 
-def simplifification(tokens):
+def isZeroFactor(token):
+    """Checks if token is a Constant/Variable which equals zero
+    """
+    return isinstance(token, (Constant, Variable)) and token.isZero()
+
+
+def isOneFactor(token):
+    """Checks if token is a Constant which equals one
+    """
+    return isinstance(token, Constant) and not isinstance(token.value, list) and token.value == 1 and token.power == 1
+
+
+def pruneTerm(term):
+    """Collapses a term (tokens between two '+'/'-' operators) having a zero factor and removes the factors which are one
+
+    Arguments:
+        term {list} -- tokens of the term
+
+    Returns:
+        term {list} -- tokens of the pruned term
+    """
+    factors = term[0::2]
+    operators = term[1::2]
+    if len(factors) == 1 or len(factors) == len(operators):
+        return term
+    if any(isinstance(factor, Binary) for factor in factors) or not all(isinstance(op, Binary) and op.value in ['*', '/'] for op in operators):
+        return term
+    if any(op.value == '/' and isZeroFactor(factor) for op, factor in zip(operators, factors[1:])):
+        return term
+    if any(isZeroFactor(factor) for factor in factors):
+        zero = Constant(0.0)
+        zero.scope = factors[0].scope
+        return [zero]
+    if all(isinstance(factor, Constant) for factor in factors):
+        return term
+    pruned = [factors[0]]
+    for op, factor in zip(operators, factors[1:]):
+        if isOneFactor(factor):
+            continue
+        if len(pruned) == 1 and isOneFactor(pruned[0]) and op.value == '*':
+            pruned = [factor]
+            continue
+        pruned.extend([op, factor])
+    return pruned
+
+
+def pruneIdentities(tokens):
+    """Top-down pass collapsing trivial operations before the simplification kernels run
+
+    Products having a zero factor become zero, factors equal to one are dropped, zero Variable terms are removed and
+    zero Constant terms are removed when there is no other Constant for the addition kernels to fold them into.
+
+    Arguments:
+        tokens {list} -- tokens list
+
+    Returns:
+        tokens {list} -- pruned tokens list
+    """
+    signs = [None]
+    terms = [[]]
+    for token in tokens:
+        if isinstance(token, Binary) and token.value in SIGN_FLIP:
+            signs.append(token)
+            terms.append([])
+        else:
+            if isinstance(token, Expression):
+                prunedTokens = pruneIdentities(token.tokens)
+                if prunedTokens != token.tokens:
+                    token = token.clone()
+                    token.tokens = prunedTokens
+            terms[-1].append(token)
+    terms = [pruneTerm(term) if term else term for term in terms]
+    zeroConstants = [len(term) == 1 and isinstance(term[0], Constant) and term[0].isZero() for term in terms]
+    constantPresent = any(len(term) == 1 and isinstance(term[0], Constant) and not zero for term, zero in zip(terms, zeroConstants))
+    # Zero Constants are left for the addition kernels to fold into another Constant, zero Variables never get folded
+    dropConstants = not constantPresent and not all(zeroConstants)
+    dropped = [(dropConstants and zeroConstant) or (len(term) == 1 and isinstance(term[0], Variable) and term[0].isZero())
+               for term, zeroConstant in zip(terms, zeroConstants)]
+    if tokens and any(dropped):
+        keep = [(i, sign, term) for i, (sign, term, drop) in enumerate(zip(signs, terms, dropped)) if not drop]
+        first = next((k for k, (_, _, term) in enumerate(keep) if term), None)
+        if first is None:
+            zero = Zero()
+            zero.scope = getattr(tokens[0], 'scope', None)
+            return [zero]
+        i, sign, term = keep[first]
+        if sign is not None and any(dropped[:i]):
+            # The first remaining term takes the place of the dropped ones, so its sign has to lead
+            if sign.value == '+':
+                sign = None
+            elif isinstance(term[0], Constant) and isNumber(term[0].value):
+                term = [term[0].clone()] + term[1:]
+                term[0].value = -term[0].value
+                sign = None
+            elif isinstance(term[0], Variable):
+                term = [term[0].clone()] + term[1:]
+                term[0].coefficient = -term[0].coefficient
+                sign = None
+            keep[first] = (i, sign, term)
+        signs = [sign for _, sign, _ in keep]
+        terms = [term for _, _, term in keep]
+    prunedTokens = []
+    for sign, term in zip(signs, terms):
+        if sign is not None:
+            prunedTokens.append(sign)
+        prunedTokens.extend(term)
+    return prunedTokens
+
+
+def simplifification(tokens, *, animate=True):
     """Simplifies given expression tokens
 
     Arguments:
         tokens {list} -- tokens list
 
+    Keyword Arguments:
+        animate {bool} -- False when the caller discards the animation (default: {True})
+
     Returns:
         tokens {list} -- tokens list
         availableOperations {list} -- list of operations
@@ -402,43 +657,38 @@ def simplifification(tokens):
         animation {list} -- list of equation simplification progress
         comments {list} -- list of solution steps
     """
-    tokens_orig = copy.deepcopy(tokens)
-    animation = [tokens_orig]
-    variables = []
+    cacheKey = (tokensToString(tokens), animate)
+    cached = cacheLookup(simplifificationCache, cacheKey)
+    if cached is not None:
+        return tuple(cached)
+    animation = []
+    if animate:
+        animation.append(snapshotTokens(tokens, animation))
     comments = []
-    variables.extend(getLevelVariables(tokens))
+    prunedTokens = pruneIdentities(tokens)
+    if prunedTokens != tokens:
+        tokens = prunedTokens
+        if animate:
+            animation.append(snapshotTokens(tokens, animation))
+        comments.append(['Removing zero terms and factors of one'])
+    variables = getLevelVariables(tokens)
     availableOperations = getOperationsExpression(variables, tokens)
     while len(availableOperations) > 0:
-        if '/' in availableOperations:
-            tokens_temp = copy.deepcopy(tokens)
-            tokens, availableOperations, token_string, anim, com = division(
-                tokens_temp)
-            animation.pop(len(animation) - 1)
-            animation.extend(anim)
-            comments.extend(com)
-        elif '*' in availableOperations:
-            tokens_temp = copy.deepcopy(tokens)
-            tokens, availableOperations, token_string, anim, com = multiplication(
-                tokens_temp)
-            animation.pop(len(animation) - 1)
-            animation.extend(anim)
-            comments.extend(com)
-        elif '+' in availableOperations:
-            tokens_temp = copy.deepcopy(tokens)
-            tokens, availableOperations, token_string, anim, com = addition(
-                tokens_temp)
-            animation.pop(len(animation) - 1)
-            animation.extend(anim)
-            comments.extend(com)
-        elif '-' in availableOperations:
-            tokens_temp = copy.deepcopy(tokens)
-            tokens, availableOperations, token_string, anim, com = subtraction(
-                tokens_temp)
+        kernel = dispatchKernel(EXPRESSION_KERNELS, availableOperations)
+        if kernel is None:
+            break
+        tokens_temp = [cloneValue(token) for token in tokens]
+        tokens, availableOperations, token_string, anim, com = kernel(tokens_temp)
+        if animate:
             animation.pop(len(animation) - 1)
             animation.extend(anim)
-            comments.extend(com)
-    tokens, animation = postSimplification(tokens, animation)
+        comments.extend(com)
+    if animate:
+        tokens, animation = postSimplification(tokens, animation)
+    else:
+        tokens, _ = postSimplification(tokens, [tokens])
     token_string = tokensToString(tokens)
+    cacheStore(simplifificationCache, cacheKey, [tokens, availableOperations, token_string, animation, comments])
     return tokens, availableOperations, token_string, animation, comments
 
 